@@ -1,24 +1,40 @@
+import atexit
 import click
+import functools
+import hashlib
+import json
 import logging
-import yaml
-import http.server
-import socketserver
 import os
-import requests
+from logging.handlers import MemoryHandler
+import pickle
 import subprocess
 import shutil
 from pathlib import Path
 from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader
+
+# Imports pesados (yaml, jinja2, urllib3, http.server) são feitos no ponto de
+# uso, para que comandos curtos como '--help' não paguem o custo de import.
 
 LOGS_DIR = Path.cwd() / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# O MemoryHandler acumula registros e grava no arquivo em lote (128 por flush),
+# reduzindo syscalls; erros são descarregados imediatamente e o atexit garante
+# que nada se perca ao final do processo
+_file_handler = logging.FileHandler(LOGS_DIR / 'linkbio_cli.log')
+# O flush delega a formatação ao handler de destino, então o formato precisa
+# ser definido nele diretamente (basicConfig só alcança o MemoryHandler)
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_memory_handler = MemoryHandler(capacity=128, flushLevel=logging.ERROR, target=_file_handler)
+atexit.register(_memory_handler.flush)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler(LOGS_DIR / 'linkbio_cli.log'),
+        _memory_handler,
         logging.StreamHandler()
     ]
 )
@@ -26,21 +42,72 @@ logger = logging.getLogger('LinkBioCLI')
 
 GITHUB_BASE_URL = "https://raw.githubusercontent.com/andersonbraz/linkbio/main"
 
-ASSET_FILES = [
+ASSET_FILES = (
     "bg-desktop-light.jpg",
     "bg-desktop.jpg",
     "bg-mobile-light.jpg",
     "bg-mobile.jpg",
     "moon-stars.svg",
     "sun.svg",
-    "favicon.svg"
-]
+    "favicon.svg",
+)
 
-TEMPLATE_FILES = [
+TEMPLATE_FILES = (
     "index.html.jinja2",
     "script.js.jinja2",
-    "style.css.jinja2"
-]
+    "style.css.jinja2",
+)
+
+# Conteúdo inicial do linkbio.yaml criado pelo comando 'start', já codificado
+# em UTF-8 no import para ser gravado com uma única syscall via write_bytes
+STARTER_YAML_BYTES = """username: 'andersonbraz_coder'
+title: 'LinkBio - Anderson Braz'
+avatar: 'https://avatars.githubusercontent.com/u/1479033?s=400&u=8b677aed22d26ab5b6d5fe84d9ae73a9c02143e8&v=4'
+url: 'https://andersonbraz.github.io/bio/'
+description: 'Project git-pages with LinkBio.'
+name_author: 'Anderson Braz'
+url_author: 'https://andersonbraz.com'
+fav_icon: 'https://raw.githubusercontent.com/andersonbraz/linkbio/main/assets/favicon.svg'
+
+nav:
+  - text: 'Awesome Data Journey'
+    url: 'https://andersonbraz.github.io'
+  - text: 'Blog'
+    url: 'https://andersonbraz.com'
+  - text: 'Credenciais'
+    url: 'https://www.credly.com/users/andersonbraz/badges'
+  - text: 'Currículo'
+    url: 'https://www.self.so/andersonbraz'
+
+social:
+  - icon: 'logo-github'
+    url: 'https://github.com/andersonbraz'
+  - icon: 'logo-instagram'
+    url: 'https://instagram.com/andersonbraz_coder'
+  - icon: 'logo-youtube'
+    url: 'https://youtube.com/@andersonbraz_coder'
+  - icon: 'logo-twitch'
+    url: 'https://www.twitch.tv/andersonbraz_coder'
+  - icon: 'logo-linkedin'
+    url: 'https://linkedin.com/in/anderson-braz'
+""".encode('utf-8')
+
+@functools.lru_cache(maxsize=8)
+def _shared_environment(templates_dir: str, cache_dir: str):
+    """Retorna um Environment Jinja2 compartilhado por diretório de templates.
+
+    Instâncias de LinkBioGenerator para o mesmo projeto reaproveitam o mesmo
+    Environment e, com ele, o cache de templates já compilados.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    # Cache de bytecode evita re-compilar os templates Jinja2 a cada execução
+    Path(cache_dir).mkdir(exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        auto_reload=False,
+    )
 
 def _run_command(command: list, cwd: Path, error_message: str):
     """Executa um comando de shell e levanta um erro em caso de falha."""
@@ -72,50 +139,151 @@ class LinkBioGenerator:
         self.assets_dir = self.root_dir / "assets"
         self.templates_dir = self.root_dir / "templates"
         self.output_dir = self.root_dir / self.OUTPUT_DIR_NAME
-        
-        self.env = Environment(loader=FileSystemLoader(self.templates_dir))
-        
+        self._etags_path = self.root_dir / ".linkbio_cache" / "etags.json"
+        self._etags: Dict[str, str] = {}
+
+        self.env = _shared_environment(str(self.templates_dir), str(self.root_dir / ".jinja_cache"))
+
         logger.info(f"Gerador inicializado. Diretório raiz: {self.root_dir}")
 
-    def _download_file(self, url: str, destination_path: Path) -> None:
+    def _download_file(self, pool: "urllib3.PoolManager", url: str, destination_path: Path) -> None:
         """Faz o download de um arquivo de uma URL e salva no destino."""
-        try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+        import urllib3
 
-            with open(destination_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        try:
+            # GET condicional: com o ETag da execução anterior o servidor responde
+            # 304 e o corpo não é transferido novamente
+            headers = {}
+            etag = self._etags.get(url)
+            if etag and destination_path.exists():
+                headers['If-None-Match'] = etag
+
+            response = pool.request('GET', url, headers=headers, preload_content=False)
+            try:
+                if response.status == 304:
+                    logger.info(f"Inalterado no servidor (304): {destination_path.name}")
+                    return
+                if response.status >= 400:
+                    raise urllib3.exceptions.HTTPError(f"HTTP {response.status} para {url}")
+
+                new_etag = response.headers.get('ETag')
+                if new_etag:
+                    self._etags[url] = new_etag
+
+                with open(destination_path, 'wb') as f:
+                    # copyfileobj copia em blocos de 64KB sem loop Python por chunk
+                    shutil.copyfileobj(response, f, length=65536)
+            finally:
+                response.release_conn()
             logger.info(f"Download concluído: {destination_path.name}")
-            
-        except requests.exceptions.RequestException as e:
+
+        except urllib3.exceptions.HTTPError as e:
             logger.error(f"Erro ao baixar {url}: {e}")
             raise
         except IOError as e:
             logger.error(f"Erro ao escrever arquivo {destination_path}: {e}")
             raise
 
-    def _write_file(self, file_path: Path, content: str) -> None:
-        """Escreve conteúdo de texto em um arquivo, com logging."""
+    def _load_etags(self) -> Dict[str, str]:
+        """Carrega o mapa de ETags de downloads anteriores, se existir."""
+        try:
+            with open(self._etags_path, 'r', encoding='utf-8') as f:
+                etags = json.load(f)
+            return etags if isinstance(etags, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_etags(self) -> None:
+        """Persiste o mapa de ETags para GETs condicionais futuros."""
+        try:
+            self._etags_path.parent.mkdir(exist_ok=True)
+            with open(self._etags_path, 'w', encoding='utf-8') as f:
+                json.dump(self._etags, f)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar o cache de ETags: {e}")
+
+    def _write_file(self, file_path: Path, content) -> None:
+        """Escreve conteúdo (str ou bytes) em um arquivo, com logging."""
         try:
-            file_path.write_text(content, encoding='utf-8') 
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            # Codifica uma única vez e grava em um único write bufferizado (menos syscalls)
+            with open(file_path, 'wb', buffering=65536) as f:
+                f.write(content)
             logger.info(f"Arquivo criado com sucesso: {file_path}")
         except IOError as e:
             logger.error(f"Erro ao criar arquivo {file_path}: {e}")
             raise
             
+    @functools.cached_property
+    def _html_template(self):
+        """Template HTML compilado, resolvido uma única vez por instância."""
+        return self.env.get_template("index.html.jinja2")
+
+    @functools.lru_cache(maxsize=None)
+    def _render_static(self, template_name: str) -> str:
+        """Renderiza (uma única vez) um template que não depende de contexto."""
+        return self.env.get_template(template_name).render()
+
+    def render_outputs(self) -> Dict[str, bytes]:
+        """Renderiza os três arquivos gerados e retorna {nome: bytes}, sem tocar no disco."""
+        config = self._load_config()
+        return {
+            "index.html": self._html_template.render(**config).encode('utf-8'),
+            "style.css": self._render_static("style.css.jinja2").encode('utf-8'),
+            "script.js": self._render_static("script.js.jinja2").encode('utf-8'),
+        }
+
+    def _compute_build_stamp(self) -> str:
+        """Hash composto dos mtimes do config e dos templates, ou '' se algum faltar."""
+        stamp = hashlib.blake2b(digest_size=16)
+        paths = [self.root_dir / "linkbio.yaml"]
+        paths += [self.templates_dir / name for name in TEMPLATE_FILES]
+        try:
+            for path in paths:
+                stamp.update(path.stat().st_mtime_ns.to_bytes(8, 'little'))
+        except FileNotFoundError:
+            return ""
+        return stamp.hexdigest()
+
     def _load_config(self) -> Dict[str, Any]:
         """Carrega e valida o arquivo linkbio.yaml."""
+        import yaml
+        try:
+            # Loader com backend em C (libyaml), bem mais rápido que o SafeLoader puro-Python
+            from yaml import CSafeLoader as _YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as _YamlLoader
+
         yaml_path = self.root_dir / "linkbio.yaml"
         if not yaml_path.exists():
             raise FileNotFoundError(f"Arquivo 'linkbio.yaml' não encontrado em {self.root_dir}. Execute 'linkbio start' primeiro.")
         
+        # Cache do parse: chave mtime+tamanho, pickle é muito mais rápido que re-parsear
+        stat = yaml_path.stat()
+        cache_key = f"{stat.st_mtime_ns}-{stat.st_size}"
+        cache_path = self.root_dir / ".linkbio_cache" / "config.pkl"
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, cached_config = pickle.load(f)
+            if cached_key == cache_key and isinstance(cached_config, dict):
+                logger.info("Configuração YAML carregada do cache.")
+                return cached_config
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass
+
         try:
             with open(yaml_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             logger.info("Configuração YAML carregada com sucesso.")
             if not isinstance(config, dict):
                  raise ValueError("O conteúdo do linkbio.yaml não é um dicionário válido.")
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump((cache_key, config), f)
+            except OSError as e:
+                logger.warning(f"Não foi possível gravar o cache de configuração: {e}")
             return config
         except yaml.YAMLError as e:
             logger.error(f"Erro ao parsear YAML: {e}")
@@ -128,86 +296,108 @@ class LinkBioGenerator:
         """
         Cria o linkbio.yaml e baixa arquivos para assets/ e templates/.
         """
+        import urllib3
+        from concurrent.futures import ThreadPoolExecutor
+
         logger.info("Iniciando start do LinkBio (criação de estrutura e download)...")
         
         self.assets_dir.mkdir(exist_ok=True)
         self.templates_dir.mkdir(exist_ok=True)
         click.echo(f"📁 Diretórios 'assets' e 'templates' criados.")
 
-        yaml_content = """username: 'andersonbraz_coder'
-title: 'LinkBio - Anderson Braz'
-avatar: 'https://avatars.githubusercontent.com/u/1479033?s=400&u=8b677aed22d26ab5b6d5fe84d9ae73a9c02143e8&v=4'
-url: 'https://andersonbraz.github.io/bio/'
-description: 'Project git-pages with LinkBio.'
-name_author: 'Anderson Braz'
-url_author: 'https://andersonbraz.com'
-fav_icon: 'https://raw.githubusercontent.com/andersonbraz/linkbio/main/assets/favicon.svg'
-
-nav:
-  - text: 'Awesome Data Journey'
-    url: 'https://andersonbraz.github.io'
-  - text: 'Blog'
-    url: 'https://andersonbraz.com'
-  - text: 'Credenciais'
-    url: 'https://www.credly.com/users/andersonbraz/badges'
-  - text: 'Currículo'
-    url: 'https://www.self.so/andersonbraz'
-
-social:
-  - icon: 'logo-github'
-    url: 'https://github.com/andersonbraz'
-  - icon: 'logo-instagram'
-    url: 'https://instagram.com/andersonbraz_coder'
-  - icon: 'logo-youtube'
-    url: 'https://youtube.com/@andersonbraz_coder'
-  - icon: 'logo-twitch'
-    url: 'https://www.twitch.tv/andersonbraz_coder'
-  - icon: 'logo-linkedin'
-    url: 'https://linkedin.com/in/anderson-braz'
-"""
         yaml_path = self.root_dir / "linkbio.yaml"
-        self._write_file(yaml_path, yaml_content)
-
-        click.echo("⬇️ Baixando Assets...")
-        for filename in ASSET_FILES:
-            url = f"{GITHUB_BASE_URL}/assets/{filename}"
-            destination = self.assets_dir / filename
-            self._download_file(url, destination)
-
-        click.echo("⬇️ Baixando Templates...")
-        for filename in TEMPLATE_FILES:
-            url = f"{GITHUB_BASE_URL}/templates/{filename}"
-            destination = self.templates_dir / filename
-            # Templates são arquivos de texto, mas _download_file lida bem com ambos
-            self._download_file(url, destination) 
+        yaml_path.write_bytes(STARTER_YAML_BYTES)
+        logger.info(f"Arquivo criado com sucesso: {yaml_path}")
+
+        click.echo("⬇️ Baixando Assets e Templates...")
+        # Templates são arquivos de texto, mas _download_file lida bem com ambos
+        tasks = [
+            (f"{GITHUB_BASE_URL}/assets/{filename}", self.assets_dir / filename)
+            for filename in ASSET_FILES
+        ] + [
+            (f"{GITHUB_BASE_URL}/templates/{filename}", self.templates_dir / filename)
+            for filename in TEMPLATE_FILES
+        ]
+        # Um único PoolManager reaproveita conexões TLS; o pool de threads baixa
+        # tudo em paralelo sem a camada extra do requests
+        self._etags = self._load_etags()
+        pool = urllib3.PoolManager(maxsize=8)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda task: self._download_file(pool, *task), tasks))
+        finally:
+            pool.clear()
+        self._save_etags()
 
         logger.info("Start concluído.")
         click.echo(f"\n✅ Start concluído! Estrutura inicial criada em: {self.root_dir}")
         click.echo("💡 Edite 'linkbio.yaml' e os templates/ e execute 'linkbio build'.")
 
+    def _sync_tree(self, source_dir: Path, destination_dir: Path) -> int:
+        """Sincroniza recursivamente fonte → destino; retorna o nº de arquivos copiados."""
+        # Se o destino existe como arquivo onde a fonte é diretório, remove-o
+        if destination_dir.exists() and not destination_dir.is_dir():
+            os.unlink(destination_dir)
+        destination_dir.mkdir(exist_ok=True)
+
+        copied = 0
+        source_names = set()
+        for entry in os.scandir(source_dir):
+            source_names.add(entry.name)
+            destination = destination_dir / entry.name
+            if entry.is_dir():
+                copied += self._sync_tree(Path(entry.path), destination)
+                continue
+            if destination.is_dir():
+                # A fonte virou arquivo onde antes havia um diretório
+                shutil.rmtree(destination)
+            src_stat = entry.stat()
+            try:
+                dst_stat = destination.stat()
+                unchanged = (dst_stat.st_size == src_stat.st_size
+                             and dst_stat.st_mtime_ns == src_stat.st_mtime_ns)
+            except FileNotFoundError:
+                unchanged = False
+            if not unchanged:
+                try:
+                    # Hardlink: zero cópia de dados quando fonte e destino
+                    # compartilham o mesmo filesystem
+                    if destination.exists():
+                        os.unlink(destination)
+                    os.link(entry.path, destination)
+                except OSError:
+                    # copy2 preserva o mtime, permitindo a comparação no próximo build
+                    shutil.copy2(entry.path, destination)
+                copied += 1
+
+        # Remove órfãos: arquivos presentes no destino mas não mais na fonte
+        for entry in os.scandir(destination_dir):
+            if entry.name not in source_names:
+                if entry.is_dir():
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+                logger.info(f"Órfão removido do destino: {entry.path}")
+
+        return copied
+
     def _copy_assets_to_output(self):
         """
-        CORRIGIDO: Copia o diretório assets/ (fonte) para page/assets/ (destino).
+        Sincroniza incrementalmente o diretório assets/ (fonte) com page/assets/ (destino).
         """
         source_dir = self.assets_dir
         # O destino é um subdiretório 'assets' dentro do diretório 'page'
-        destination_dir = self.output_dir / "assets" 
-        
+        destination_dir = self.output_dir / "assets"
+
         if not source_dir.is_dir():
             logger.warning(f"Diretório assets não encontrado em {source_dir}. Pulando cópia.")
             return
 
         try:
+            self.output_dir.mkdir(exist_ok=True)
+            copied = self._sync_tree(source_dir, destination_dir)
+            logger.info(f"Assets sincronizados em {destination_dir} ({copied} arquivo(s) copiado(s)).")
 
-            self.output_dir.mkdir(exist_ok=True) 
-
-            if destination_dir.exists():
-                shutil.rmtree(destination_dir)
-                logger.info(f"Diretório antigo {destination_dir} removido.")
-            
-            shutil.copytree(source_dir, destination_dir)
-            logger.info(f"Diretório assets copiado para {destination_dir}")
-            
         except Exception as e:
             logger.error(f"Erro ao copiar diretório assets: {e}")
             click.echo(f"⚠️ Aviso: Falha ao copiar assets/ para page/assets. Erro: {e}")
@@ -217,28 +407,50 @@ social:
         """
         Cria a pasta 'page/', carrega config YAML, gera HTML/CSS/JS e COPIA OS ASSETS CORRETAMENTE.
         """
+        import jinja2
+        import yaml
+
         logger.info("Iniciando build do LinkBio...")
 
         self.output_dir.mkdir(exist_ok=True)
         logger.info(f"Diretório 'page' criado/verificado.")
 
+        # Build incremental: se config e templates não mudaram desde o último
+        # build e os arquivos gerados ainda existem, pula o render/escrita;
+        # os assets ainda são sincronizados
+        stamp = self._compute_build_stamp()
+        # Fora de page/ para não ser publicado no gh-pages junto com o site
+        stamp_path = self.root_dir / ".linkbio_cache" / "build-stamp"
+        outputs_present = all(
+            (self.output_dir / name).exists()
+            for name in ("index.html", "style.css", "script.js")
+        )
+        if stamp and outputs_present and stamp_path.exists() and stamp_path.read_text() == stamp:
+            logger.info("Config e templates inalterados: render pulado.")
+            self._copy_assets_to_output()
+            click.echo(f"✅ Build já atualizado! Arquivos em: {self.output_dir}")
+            return
+
         try:
-            config = self._load_config()
+            outputs = self.render_outputs()
         except (FileNotFoundError, yaml.YAMLError, ValueError):
             click.echo("❌ Falha no build: Verifique os logs e o arquivo linkbio.yaml.")
             return
+        except jinja2.TemplateError as e:
+            logger.error(f"Erro durante a renderização ou escrita: {e}")
+            click.echo(f"❌ Erro durante o build: {e}")
+            return
 
         try:
-            html_template = self.env.get_template("index.html.jinja2")
-            css_template = self.env.get_template("style.css.jinja2")
-            js_template = self.env.get_template("script.js.jinja2")
+            for name, content in outputs.items():
+                self._write_file(self.output_dir / name, content)
 
-            self._write_file(self.output_dir / "index.html", html_template.render(**config))
-            self._write_file(self.output_dir / "style.css", css_template.render())
-            self._write_file(self.output_dir / "script.js", js_template.render())
-            
-            self._copy_assets_to_output() 
-            
+
+            self._copy_assets_to_output()
+
+            if stamp:
+                stamp_path.parent.mkdir(exist_ok=True)
+                stamp_path.write_text(stamp)
             logger.info("Build concluído.")
             click.echo(f"✅ Build concluído! Arquivos gerados em: {self.output_dir}")
             click.echo("💡 Use 'linkbio preview' para visualizar a página.")
@@ -378,26 +590,60 @@ def build(path):
 @click.option('--path', default='.', help='Diretório raiz do projeto.')
 def preview(port, path):
     """
-    Roda o build e inicia um webserver simples para visualização da página gerada.
+    Renderiza a página em memória e inicia um webserver simples para visualização.
     """
+    import http.server
+
     root_dir = Path(path).resolve()
     generator = LinkBioGenerator(root_dir)
-    
-    click.echo("🛠️ Executando build antes do preview...")
-    generator.build()
-    
+
+    click.echo("🛠️ Renderizando em memória para o preview...")
+    try:
+        outputs = generator.render_outputs()
+    except Exception as e:
+        click.echo(f"❌ Falha ao renderizar: {e}")
+        logger.error(f"Falha ao renderizar para o preview: {e}")
+        return
+
+    # Assets continuam servidos do disco; só os arquivos gerados ficam em memória
+    generator.output_dir.mkdir(exist_ok=True)
+    generator._copy_assets_to_output()
+
     web_dir = generator.output_dir # 'page/'
-    
-    if not web_dir.is_dir():
-         click.echo(f"❌ Erro: Diretório de build não encontrado em {web_dir}. Execute 'linkbio build' primeiro.")
-         return
 
-    Handler = http.server.SimpleHTTPRequestHandler
-    original_cwd = os.getcwd()
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        """Serve os arquivos gerados direto da memória; o resto vem de page/."""
+
+        def __init__(self, *args, **kwargs):
+            # directory= evita o os.chdir global, que não é seguro com o servidor em threads
+            super().__init__(*args, directory=str(web_dir), **kwargs)
+
+        def _send_from_memory(self, send_body: bool) -> bool:
+            """Responde da memória se o caminho for um arquivo gerado."""
+            name = self.path.split('?', 1)[0].lstrip('/') or "index.html"
+            content = outputs.get(name)
+            if content is None:
+                return False
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(name))
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(content)
+            return True
+
+        def do_GET(self):
+            if not self._send_from_memory(send_body=True):
+                super().do_GET()
+
+        def do_HEAD(self):
+            # Mesmos cabeçalhos do GET, sem corpo, para GET e HEAD não divergirem
+            if not self._send_from_memory(send_body=False):
+                super().do_HEAD()
 
     try:
-        os.chdir(web_dir) 
-        with socketserver.TCPServer(("", port), Handler) as httpd:
+        # ThreadingHTTPServer atende requisições em paralelo (CSS/JS/imagens do browser)
+        with http.server.ThreadingHTTPServer(("", port), Handler) as httpd:
             click.echo(f"\n🚀 Servidor de preview rodando em: http://127.0.0.1:{port}")
             click.echo("   Pressione Ctrl+C para sair...")
             logger.info(f"Servidor de preview iniciado na porta {port}, servindo de {web_dir}")
@@ -408,9 +654,6 @@ def preview(port, path):
     except Exception as e:
         click.echo(f"❌ Erro ao iniciar o servidor: {e}")
         logger.error(f"Erro no servidor de preview: {e}")
-    finally:
-        os.chdir(original_cwd)
-        logger.info("Limpeza do diretório de trabalho concluída.")
 
 @cli.command()
 @click.option('--path', default='.', help='Diretório raiz do projeto.')